@@ -8,6 +8,7 @@ Usage:
     python cow_analyzer.py "04-09-2025*Attack Log.csv" "04-09-2025*Defense Log.csv" ...
     python cow_analyzer.py ./*.csv
 If no arguments are given, the script will process all "*.csv" in the current folder.
+Attack, defense or combined logs are recognized from their content, not their file name.
 """
 
 import sys
@@ -18,77 +19,89 @@ import json
 from io import StringIO
 import pandas as pd
 
-# -------- CONFIG: adjust guild members & fort lists here if needed ----------
-GUILD_MEMBERS = {
-    "LOKI","LoveBigFeet","Frodo","H4V0C","Wadjet..","HAI","Nemo","CKG","yoyo",
-    "Barah","FakeTaxi","georgesantos","Mokree","Masterlynch","DLGS","XungCa",
-    "BuzzKill","Obi-Wan Kenobi","DrStein","Samujas","Pelarian Jauh","ElenDil",
-    "kaliber 44","Biff","Pepp","Avalon"
-}
-GUILD_NORM = {g.strip().lower() for g in GUILD_MEMBERS}
-
-HERO_FORTS = {"Barracks","Mage Academy","Lighthouse","Foundry","Engineerium","Shooting Range",
-    "Bastion","Heroes' Bridge","Alchemy Tower","City Hall","Citadel"}
-TITAN_FORTS = {"Bridge","Spring of Elements","Bastion of Fire","Gates of Nature","Bastion of Ice",
-    "Altar of Life","Ether Prism","Sun Temple","Moon Temple"}
-HERO_SET = set(f.lower() for f in HERO_FORTS)
-TITAN_SET = set(f.lower() for f in TITAN_FORTS)
-
-# Patterns to ignore as "defender candidate" (buff labels, UI text)
-_IGNORE_RE = re.compile(
-    r"(skill|cooldown|decrease|increase|bonus|fortification|captured|victory|defeat|points|\+|attack|defense|buff|resist|reduction|chance|critical|stun|heal|regen|immunity)",
-    flags=re.IGNORECASE
-)
+# -------- CONFIG: guild members, aliases & fort lists live in cow_config.json ----------
+from cow_config import load_config, clean_base_fort, strip_parens
+from cow_export import export_wars
 
 # Season file output
 SEASON_FILE = Path("season_scores.json")
 
-# ----------------- utility functions -----------------
-def _clean_base_fort(name):
-    """Remove parentheses and whitespace, lowercased base fort name (used to decide Heroes/Titans)"""
-    return re.sub(r"\s*\(.*?\)","", str(name)).strip().lower()
+# ----------------- parsers -----------------
+ATTACK_COLUMNS = ["Fortification","BaseFort","Attacker","Result","Points","Type"]
+DEFENSE_COLUMNS = ["Fortification","BaseFort","Defender","Type"]
 
-def parse_attack_text(text):
+# how many data lines of a block parse_log_text() looks at to decide its kind
+SNIFF_LINES = 50
+
+def _points(value):
+    try:
+        return float(value.replace("+",""))
+    except:
+        return 0.0
+
+def _is_attack_line(cols):
+    return len(cols) >= 4 and cols[1] in ("Victory","Defeat") and cols[2].startswith("+")
+
+def _is_bonus_line(cols):
+    """Fortification captured +XXX lines"""
+    return len(cols) >= 3 and cols[1] == "Fortification captured" and cols[2].startswith("+")
+
+def _is_data_line(cols):
+    """Victory / Defeat / Fortification captured lines; anything else (headers, titles) separates blocks"""
+    return len(cols) >= 2 and cols[1].lower() in ("victory","defeat","fortification captured")
+
+def kind_from_name(name):
+    """"attack" / "defense" from an 'Attack Log' / 'Defense Log' marker in a file name or title line"""
+    low = str(name).lower()
+    if "attack log" in low:
+        return "attack"
+    if "defense log" in low:
+        return "defense"
+    return None
+
+def _find_defender_at(cols, cfg):
+    """Scan from end to start for the likely defender name; (canonical member name, column) or (None, None)"""
+    for i in range(len(cols) - 1, -1, -1):
+        cclean = strip_parens(cols[i])
+        if not cclean:
+            continue
+        # exact / alphanumeric approximate match against roster + aliases
+        defender = cfg.match_member(cclean)
+        if defender:
+            return defender, i
+        # skip buff/labels
+        if cfg.is_ignored(cclean):
+            continue
+        # otherwise not a player name -> continue searching
+    return None, None
+
+def _find_defender(cols, cfg):
+    return _find_defender_at(cols, cfg)[0]
+
+def _line_evidence(cols, cfg):
     """
-    Parse an attack log text (CSV-like).
-    Returns a DataFrame with columns:
-      Fortification, BaseFort, Attacker, Result, Points, Type
-    Also includes additional rows with Result == "Bonus" representing distributed bonus shares.
+    Roster evidence of one data line: (vote, attacker, defender)
+      attacker  canonical member in the attacker column of a Victory/Defeat +points line, else None
+      defender  _find_defender() result
+      vote      "defense" when a member appears after the attacker column (or anywhere on a
+                non-attack line), "attack" when the attacker is the only member, else None
     """
-    rows = []
-    bonuses = {}  # base_fort -> total bonus to distribute
-    for line in text.splitlines():
-        cols = [c.strip() for c in line.split(",")]
-        if len(cols) >= 4 and cols[1] in ("Victory","Defeat") and cols[2].startswith("+"):
-            fort_display = cols[0]
-            base_fort = _clean_base_fort(fort_display)
-            result = cols[1]
-            try:
-                pts = float(cols[2].replace("+",""))
-            except:
-                pts = 0.0
-            attacker = re.sub(r"\s*\(.*?\)","", cols[3]).strip()
-            rows.append({
-                "Fortification": fort_display,
-                "BaseFort": base_fort,
-                "Attacker": attacker,
-                "Result": result,
-                "Points": pts
-            })
-        # Fortification captured +XXX lines
-        elif len(cols) >= 3 and cols[1] == "Fortification captured" and cols[2].startswith("+"):
-            base = _clean_base_fort(cols[0])
-            try:
-                bonus = float(cols[2].replace("+",""))
-            except:
-                bonus = 0.0
-            bonuses[base] = bonuses.get(base, 0.0) + bonus
+    if _is_bonus_line(cols):
+        return None, None, None
+    defender, col = _find_defender_at(cols, cfg)
+    if not _is_attack_line(cols):
+        return ("defense" if defender else None), None, defender
+    attacker = defender if col == 3 else cfg.match_member(strip_parens(cols[3]))
+    if defender and col > 3:
+        return "defense", attacker, defender
+    return ("attack" if attacker else None), attacker, defender
 
+def _attack_frame(rows, bonuses, cfg):
     if not rows:
-        return pd.DataFrame(columns=["Fortification","BaseFort","Attacker","Result","Points","Type"])
+        return pd.DataFrame(columns=ATTACK_COLUMNS)
 
     df = pd.DataFrame(rows)
-    df["Type"] = df["BaseFort"].apply(lambda x: "Heroes" if x in HERO_SET else ("Titans" if x in TITAN_SET else "Unknown"))
+    df["Type"] = df["BaseFort"].map(cfg.fort_type)
 
     # Distribute bonuses: for each base fort, find all winning attack occurrences and give each occurrence a share.
     bonus_rows = []
@@ -108,143 +121,229 @@ def parse_attack_text(text):
                 })
     if bonus_rows:
         df = pd.concat([df, pd.DataFrame(bonus_rows)], ignore_index=True)
-
     return df
 
-def parse_defense_text_strict(text):
+def parse_log_text(text, cfg=None, kind=None, members_only=False, hint=None):
     """
-    Strict defense parser: accepts as defender only names that match GUILD_NORM (or close alnum match).
-    Returns DataFrame with columns: Fortification, BaseFort, Defender, Type
-    We consider a defense successful when the log line's second column is 'Defeat' (attacker defeated).
+    Single-pass parser for attack, defense or combined logs. cfg is a GuildConfig
+    (default: load_config()). Lines are read and split once and routed to the attack,
+    bonus or defense row builder according to the kind of the block they belong to.
+    Blocks are runs of Victory/Defeat/Fortification captured lines separated by header
+    or title lines (a combined export is an attack block and a defense block).
+      kind "attack" / "defense"  every block is of that kind
+      kind None / "mixed"        each block is decided once, by majority of the roster
+                                 evidence of its first SNIFF_LINES data lines (see
+                                 _line_evidence); those lines wait in a buffer and are
+                                 routed with their cached lookups once the block is decided
+    A block without a majority takes the kind named in its title line or hint (e.g.
+    kind_from_name(file name)). If nothing in the whole text decides any block, a log of
+    Victory/Defeat +points lines is an attack log by its shape (with a warning); an
+    undecided block next to decided ones is skipped with a warning rather than guessed.
+    In attack blocks Victory/Defeat +points lines become attack rows (non-members kept
+    as logged unless members_only) and Fortification captured lines feed the bonus pool;
+    in defense blocks lines with a guild member as defender become defense rows, and
+    capture bonuses (the enemy's) are ignored.
+    Returns (attack_df, defense_df) with the columns of parse_attack_text / parse_defense_text_strict.
     """
-    rows = []
-    for line in text.splitlines():
+    cfg = cfg or load_config()
+    forced = kind if kind in ("attack","defense") else None
+    attack_rows = []
+    bonuses = {}  # base_fort -> total bonus to distribute
+    defense_rows = []
+
+    def route(cols, block_kind, evidence=None):
+        if block_kind == "attack":
+            if _is_attack_line(cols):
+                attacker = strip_parens(cols[3])
+                member = evidence[1] if evidence else cfg.match_member(attacker)
+                if member or not members_only:
+                    # aliases -> canonical roster name; non-members are kept as logged
+                    attack_rows.append({
+                        "Fortification": cols[0],
+                        "BaseFort": clean_base_fort(cols[0]),
+                        "Attacker": member or attacker,
+                        "Result": cols[1],
+                        "Points": _points(cols[2])
+                    })
+            elif _is_bonus_line(cols):
+                base = clean_base_fort(cols[0])
+                bonuses[base] = bonuses.get(base, 0.0) + _points(cols[2])
+        # We consider a defense successful when the log line's second column is 'Defeat' (attacker defeated).
+        elif block_kind == "defense" and cols[1].lower() == "defeat":
+            defender = evidence[2] if evidence else _find_defender(cols, cfg)
+            if defender:
+                base = clean_base_fort(cols[0])
+                defense_rows.append({
+                    "Fortification": cols[0],
+                    "BaseFort": base,
+                    "Defender": defender,
+                    "Type": cfg.fort_type(base)
+                })
+
+    def decide(block, final):
+        votes = block["votes"]
+        if votes["attack"] != votes["defense"]:
+            block["kind"] = "attack" if votes["attack"] > votes["defense"] else "defense"
+        elif final:
+            block["kind"] = block["hint"] or hint
+        if block["kind"]:
+            for cols, evidence in block["lines"]:
+                route(cols, block["kind"], evidence)
+            block["lines"] = []
+
+    blocks = []
+
+    def new_block(lineno):
+        # lines: buffered (cols, evidence) of a block whose kind is not decided yet
+        blocks.append({"start": lineno, "kind": forced, "hint": None, "seen": 0, "lines": [], "votes": {"attack": 0, "defense": 0}})
+        return blocks[-1]
+
+    block = None
+    for lineno, line in enumerate(text.splitlines(), 1):
+        if not line.strip():
+            continue
         cols = [c.strip() for c in line.split(",")]
-        if len(cols) < 2:
+        if not _is_data_line(cols):
+            # a header/title line after data lines starts a new block
+            if block is None or block["seen"]:
+                if block is not None and not block["kind"]:
+                    decide(block, final=True)
+                block = new_block(lineno)
+            block["hint"] = block["hint"] or kind_from_name(line)
             continue
-        fort = cols[0]
-        result = cols[1].lower()
-        base = _clean_base_fort(fort)
-        defender = None
-        # scan from end to start for the likely defender name
-        for cand in reversed(cols):
-            cclean = re.sub(r"\s*\(.*?\)","", cand).strip()
-            if not cclean:
-                continue
-            cnorm = cclean.lower()
-            if cnorm in GUILD_NORM:
-                defender = cclean
-                break
-            # alphanumeric approximate match
-            cand_alnum = re.sub(r'[^a-z0-9]','', cnorm)
-            if cand_alnum and any(re.sub(r'[^a-z0-9]','',g)==cand_alnum for g in GUILD_NORM):
-                defender = cclean
-                break
-            # skip buff/labels
-            if _IGNORE_RE.search(cclean):
-                continue
-            # otherwise not a player name -> continue searching
-        if defender and result == "defeat":
-            if base in HERO_SET:
-                btype = "Heroes"
-            elif base in TITAN_SET:
-                btype = "Titans"
-            else:
-                btype = "Unknown"
-            rows.append({
-                "Fortification": fort,
-                "BaseFort": base,
-                "Defender": defender,
-                "Type": btype
-            })
-    if not rows:
-        return pd.DataFrame(columns=["Fortification","BaseFort","Defender","Type"])
-    return pd.DataFrame(rows)
+        if block is None:
+            block = new_block(lineno)
+        block["seen"] += 1
+        if block["kind"]:
+            route(cols, block["kind"])
+            continue
+        evidence = _line_evidence(cols, cfg)
+        block["lines"].append((cols, evidence))
+        if evidence[0]:
+            block["votes"][evidence[0]] += 1
+        if len(block["lines"]) >= SNIFF_LINES:
+            decide(block, final=False)
+    if block is not None and not block["kind"]:
+        decide(block, final=True)
+
+    undecided = [b for b in blocks if not b["kind"] and b["lines"]]
+    if undecided:
+        if len(undecided) == len([b for b in blocks if b["seen"]]) and \
+                any(_is_attack_line(cols) or _is_bonus_line(cols) for b in undecided for cols, _ in b["lines"]):
+            # no guild member anywhere and no name hint: Victory/Defeat +points / Fortification
+            # captured lines still make it an attack log by their shape (e.g. new recruits, stale roster)
+            print("Warning: no guild member found in log; treating it as an attack log by its line shape")
+            for b in undecided:
+                b["kind"] = "attack"
+                for cols, evidence in b["lines"]:
+                    route(cols, "attack", evidence)
+        else:
+            for b in undecided:
+                print(f"Warning: cannot tell whether the block at line {b['start']} is attack or defense "
+                      f"(no guild member found); skipped")
+
+    attack_df = _attack_frame(attack_rows, bonuses, cfg)
+    defense_df = pd.DataFrame(defense_rows) if defense_rows else pd.DataFrame(columns=DEFENSE_COLUMNS)
+    return attack_df, defense_df
+
+def parse_attack_text(text, cfg=None):
+    """
+    Parse an attack log text (CSV-like). cfg is a GuildConfig (default: load_config()).
+    Returns a DataFrame with columns:
+      Fortification, BaseFort, Attacker, Result, Points, Type
+    Also includes additional rows with Result == "Bonus" representing distributed bonus shares.
+    """
+    return parse_log_text(text, cfg, kind="attack")[0]
+
+def parse_defense_text_strict(text, cfg=None):
+    """
+    Strict defense parser: accepts as defender only names that match the configured roster
+    or aliases (case-insensitive or close alnum match); the canonical member name is reported.
+    Returns DataFrame with columns: Fortification, BaseFort, Defender, Type
+    We consider a defense successful when the log line's second column is 'Defeat' (attacker defeated).
+    """
+    return parse_log_text(text, cfg, kind="defense")[1]
 
 # ----------------- season helpers -----------------
-def load_season():
-    if SEASON_FILE.exists():
-        try:
-            return json.loads(SEASON_FILE.read_text(encoding="utf-8"))
-        except Exception:
-            return {"heroes_attack":{}, "titans_attack":{}, "heroes_defense":{}, "titans_defense":{}}
+def _empty_season():
     return {"heroes_attack":{}, "titans_attack":{}, "heroes_defense":{}, "titans_defense":{}}
 
-def save_season(season):
-    SEASON_FILE.write_text(json.dumps(season, indent=2), encoding="utf-8")
+def load_season(path=None):
+    path = Path(path) if path else SEASON_FILE
+    if path.exists():
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return _empty_season()
+    return _empty_season()
 
-# ----------------- main processing -----------------
-def main(argv):
-    parser = argparse.ArgumentParser(description="Process CoW logs and generate ranking files")
-    parser.add_argument("files", nargs="*", help="CSV log files (globs allowed). If none, all *.csv in cwd are processed.")
-    parser.add_argument("--no-save-season", action="store_true", help="Do not update season_scores.json")
-    args = parser.parse_args(argv)
+def save_season(season, path=None):
+    path = Path(path) if path else SEASON_FILE
+    path.write_text(json.dumps(season, indent=2), encoding="utf-8")
 
-    # resolve input files
-    files = []
-    if not args.files:
-        files = sorted(Path(".").glob("*.csv"))
-    else:
-        for pattern in args.files:
-            files.extend(sorted(Path(".").glob(pattern)))
-    files = [p for p in files if p.is_file()]
-    if not files:
-        print("No CSV files found to process.")
-        return 1
+def accumulate_season(season, attack_df, defense_df):
+    """Add one war's attack points and defense counts to the season totals (in place)"""
+    if not attack_df.empty:
+        for t in ("Heroes","Titans"):
+            sub = attack_df[attack_df["Type"]==t].groupby("Attacker")["Points"].sum()
+            key_s = f"{t.lower()}_attack"
+            season.setdefault(key_s, {})
+            for player, pts in sub.items():
+                season[key_s][player] = season[key_s].get(player, 0.0) + float(pts)
+    if not defense_df.empty:
+        for t in ("Heroes","Titans"):
+            sub = defense_df[defense_df["Type"]==t]["Defender"].value_counts()
+            key_s = f"{t.lower()}_defense"
+            season.setdefault(key_s, {})
+            for player, cnt in sub.items():
+                season[key_s][player] = season[key_s].get(player, 0) + int(cnt)
 
-    # group files by date prefix (dd-mm-yyyy) if present, else by filename
+# ----------------- war processing -----------------
+def group_war_files(files):
+    """
+    Group files by date prefix (dd-mm-yyyy) if present, else by filename.
+    The log type is not taken from the name: parse_war() detects it from the content.
+    Returns {key: {"files": [Path, ...]}}
+    """
     groups = {}
     for p in files:
         m = re.match(r"(\d{2}-\d{2}-\d{4})", p.name)
         key = m.group(1) if m else p.name
-        groups.setdefault(key, {"attack": None, "defense": None, "attack_path": None, "defense_path": None})
-        if "attack log" in p.name.lower():
-            groups[key]["attack"] = p
-            groups[key]["attack_path"] = p.name
-        if "defense log" in p.name.lower():
-            groups[key]["defense"] = p
-            groups[key]["defense_path"] = p.name
-    # process each group
-    season = load_season()
-    per_war = {}
-    for key, info in sorted(groups.items(), key=lambda x: x[0]):
-        attack_df = pd.DataFrame()
-        defense_df = pd.DataFrame()
-        # read attack
-        if info["attack"]:
-            try:
-                txt = info["attack"].read_text(encoding="utf-8", errors="ignore")
-                attack_df = parse_attack_text(txt)
-            except Exception as e:
-                print(f"Error reading/parsing attack file {info['attack']}: {e}")
-        # read defense
-        if info["defense"]:
-            try:
-                txt = info["defense"].read_text(encoding="utf-8", errors="ignore")
-                defense_df = parse_defense_text_strict(txt)
-            except Exception as e:
-                print(f"Error reading/parsing defense file {info['defense']}: {e}")
-
-        per_war[key] = {"attack": attack_df, "defense": defense_df, "attack_path": info.get("attack_path"), "defense_path": info.get("defense_path")}
-
-        # accumulate into season
-        if not attack_df.empty:
-            for t in ("Heroes","Titans"):
-                sub = attack_df[attack_df["Type"]==t].groupby("Attacker")["Points"].sum()
-                key_s = f"{t.lower()}_attack"
-                for player, pts in sub.items():
-                    season[key_s][player] = season[key_s].get(player, 0.0) + float(pts)
-        if not defense_df.empty:
-            for t in ("Heroes","Titans"):
-                sub = defense_df[defense_df["Type"]==t]["Defender"].value_counts()
-                key_s = f"{t.lower()}_defense"
-                for player, cnt in sub.items():
-                    season[key_s][player] = season[key_s].get(player, 0) + int(cnt)
+        groups.setdefault(key, {"files": []})["files"].append(p)
+    return groups
 
-    # Save season if requested
-    if not args.no_save_season:
-        save_season(season)
-        print(f"Season saved to: {SEASON_FILE}")
+def parse_war(info, config_file=None):
+    """
+    Read and parse (one pass each, attack/defense detected from content) the files of one war group.
+    Top-level and path-based so it can run in a worker process (see cow_batch.py).
+    Returns (attack_df, defense_df).
+    """
+    cfg = load_config(config_file)
+    attack_dfs = []
+    defense_dfs = []
+    for path in info["files"]:
+        try:
+            txt = path.read_text(encoding="utf-8", errors="ignore")
+            a, d = parse_log_text(txt, cfg, hint=kind_from_name(path.name))
+        except Exception as e:
+            print(f"Error reading/parsing log file {path}: {e}")
+            continue
+        if a.empty and d.empty:
+            print(f"Warning: no attack or defense lines recognized in {path}")
+        if not a.empty:
+            attack_dfs.append(a)
+        if not d.empty:
+            defense_dfs.append(d)
+    attack_df = pd.concat(attack_dfs, ignore_index=True) if attack_dfs else pd.DataFrame()
+    defense_df = pd.concat(defense_dfs, ignore_index=True) if defense_dfs else pd.DataFrame()
+    return attack_df, defense_df
+
+def write_outputs(per_war, season, out_dir=None):
+    """
+    Write heroes.xlsx, titans.xlsx and season_summary_all.xlsx into out_dir (default: cwd).
+    Returns the season summary DataFrames (heroes attack, titans attack, heroes defense, titans defense).
+    """
+    out_dir = Path(out_dir) if out_dir else Path(".")
 
     # Prepare Excel outputs: heroes.xlsx and titans.xlsx
     heroes_attack = []
@@ -279,8 +378,8 @@ def main(argv):
     td_season = pd.DataFrame(sorted(season.get("titans_defense",{}).items(), key=lambda x:-x[1]), columns=["Defender","Count"])
 
     # write heroes.xlsx and titans.xlsx
-    out_heroes = Path("heroes.xlsx")
-    out_titans = Path("titans.xlsx")
+    out_heroes = out_dir / "heroes.xlsx"
+    out_titans = out_dir / "titans.xlsx"
     with pd.ExcelWriter(out_heroes, engine="openpyxl") as writer:
         heroes_attack_df.to_excel(writer, sheet_name="Attack_Per_War", index=False)
         heroes_defense_df.to_excel(writer, sheet_name="Defense_Per_War", index=False)
@@ -294,7 +393,7 @@ def main(argv):
 
     print(f"Saved: {out_heroes.name}, {out_titans.name}")
     # also save a compact season_summary_all.xlsx
-    out_compact = Path("season_summary_all.xlsx")
+    out_compact = out_dir / "season_summary_all.xlsx"
     with pd.ExcelWriter(out_compact, engine="openpyxl") as writer:
         ha_season.to_excel(writer, sheet_name="Heroes_Attack_Season", index=False)
         hd_season.to_excel(writer, sheet_name="Heroes_Defense_Season", index=False)
@@ -302,6 +401,52 @@ def main(argv):
         td_season.to_excel(writer, sheet_name="Titans_Defense_Season", index=False)
     print(f"Saved: {out_compact.name}")
 
+    return ha_season, ta_season, hd_season, td_season
+
+# ----------------- main processing -----------------
+def main(argv):
+    parser = argparse.ArgumentParser(description="Process CoW logs and generate ranking files")
+    parser.add_argument("files", nargs="*", help="CSV log files (globs allowed). If none, all *.csv in cwd are processed.")
+    parser.add_argument("--no-save-season", action="store_true", help="Do not update season_scores.json")
+    parser.add_argument("--config", default=None, help="Guild config JSON (default: $COW_CONFIG or cow_config.json next to the script)")
+    parser.add_argument("--export", default=None, help="Append parsed battle rows to this partitioned dataset dir (Parquet, CSV without pyarrow)")
+    parser.add_argument("--season", default=None, help="Season partition name, required with --export (e.g. 2025-09)")
+    args = parser.parse_args(argv)
+    if args.export and not args.season:
+        parser.error("--export requires --season")
+
+    # resolve input files
+    files = []
+    if not args.files:
+        files = sorted(Path(".").glob("*.csv"))
+    else:
+        for pattern in args.files:
+            files.extend(sorted(Path(".").glob(pattern)))
+    files = [p for p in files if p.is_file()]
+    if not files:
+        print("No CSV files found to process.")
+        return 1
+
+    groups = group_war_files(files)
+    # process each group
+    season = load_season()
+    per_war = {}
+    for key, info in sorted(groups.items(), key=lambda x: x[0]):
+        attack_df, defense_df = parse_war(info, args.config)
+        per_war[key] = {"attack": attack_df, "defense": defense_df, "files": [p.name for p in info["files"]]}
+        accumulate_season(season, attack_df, defense_df)
+
+    # Save season if requested
+    if not args.no_save_season:
+        save_season(season)
+        print(f"Season saved to: {SEASON_FILE}")
+
+    if args.export:
+        written = export_wars(args.export, args.season, per_war)
+        print(f"Exported {len(written)} partition file(s) to: {args.export}")
+
+    ha_season, ta_season, hd_season, td_season = write_outputs(per_war, season)
+
     # Print short console summary (season top 10)
     print("\n=== Season Top (Heroes Attack) ===")
     print(ha_season.head(10).to_string(index=False))
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+cow_batch.py
+Process several guilds in one run. Each guild is a directory containing:
+    cow_config.json       the guild roster / forts (see cow_config.py)
+    *.csv                 Attack / Defense logs
+    season_scores.json    the guild season store (created / updated here)
+The war groups of all guilds are parsed on one shared process pool; season totals and
+Excel outputs (heroes.xlsx, titans.xlsx, season_summary_all.xlsx) are written per guild.
+
+Usage:
+    python cow_batch.py guilds/Alpha guilds/Beta guilds/Gamma
+    python cow_batch.py guilds/* --workers 4
+"""
+
+import sys
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from cow_analyzer import (
+    SEASON_FILE, group_war_files, parse_war, load_season, save_season,
+    accumulate_season, write_outputs,
+)
+from cow_config import DEFAULT_CONFIG_FILE, load_config
+from cow_export import export_wars
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Process CoW logs of several guilds (one directory per guild)")
+    parser.add_argument("guild_dirs", nargs="+", help="Guild directories, each with its own cow_config.json and CSV logs")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--no-save-season", action="store_true", help="Do not update the guilds' season_scores.json")
+    parser.add_argument("--export", default=None, help="Dataset dir for parsed battle rows; each guild goes to <export>/<guild dir name> (names must be distinct)")
+    parser.add_argument("--season", default=None, help="Season partition name, required with --export (e.g. 2025-09)")
+    args = parser.parse_args(argv)
+    if args.export and not args.season:
+        parser.error("--export requires --season")
+
+    # resolve guilds: dir -> (config file, war groups)
+    guilds = {}
+    for d in args.guild_dirs:
+        gdir = Path(d)
+        config_file = gdir / DEFAULT_CONFIG_FILE.name
+        if not gdir.is_dir() or not config_file.is_file():
+            print(f"Skipping {gdir}: not a directory with {DEFAULT_CONFIG_FILE.name}")
+            continue
+        # validate here so a broken roster fails its own guild before anything is submitted
+        try:
+            load_config(config_file)
+        except Exception as e:
+            print(f"Skipping {gdir}: invalid {config_file.name}: {e}")
+            continue
+        files = sorted(p for p in gdir.glob("*.csv") if p.is_file())
+        if not files:
+            print(f"Skipping {gdir}: no CSV files found")
+            continue
+        guilds[gdir] = (config_file, group_war_files(files))
+    if not guilds:
+        print("No guild directories to process.")
+        return 1
+    # export subdirs are keyed by directory name: two guilds named alike would overwrite each other
+    if args.export:
+        names = [gdir.name for gdir in guilds]
+        dups = sorted({n for n in names if names.count(n) > 1})
+        if dups:
+            parser.error(f"--export needs distinct guild directory names, duplicated: {', '.join(dups)}")
+
+    # parse every war of every guild on one shared pool
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            (gdir, key): pool.submit(parse_war, info, config_file)
+            for gdir, (config_file, groups) in guilds.items()
+            for key, info in groups.items()
+        }
+
+        failed = 0
+        # accumulate per guild in war order, each into its own season store
+        for gdir, (config_file, groups) in guilds.items():
+            season_file = gdir / SEASON_FILE.name
+            season = load_season(season_file)
+            per_war = {}
+            try:
+                for key, info in sorted(groups.items(), key=lambda x: x[0]):
+                    attack_df, defense_df = futures[(gdir, key)].result()
+                    per_war[key] = {"attack": attack_df, "defense": defense_df, "files": [p.name for p in info["files"]]}
+                    accumulate_season(season, attack_df, defense_df)
+
+                print(f"\n=== {gdir.name}: {len(per_war)} war(s) ===")
+                if args.export:
+                    written = export_wars(Path(args.export) / gdir.name, args.season, per_war)
+                    print(f"Exported {len(written)} partition file(s) to: {Path(args.export) / gdir.name}")
+                write_outputs(per_war, season, gdir)
+                # season store last: a failed run never leaves it ahead of the Excel files
+                if not args.no_save_season:
+                    save_season(season, season_file)
+                    print(f"Season saved to: {season_file}")
+            except Exception as e:
+                # one guild failing must not stop the others
+                print(f"\n=== {gdir.name}: FAILED, season not updated: {e} ===")
+                failed += 1
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,116 @@
+"""
+cow_config.py
+Guild roster / fortification config shared by cow_analyzer.py and cow_dashboard_full.py.
+
+The config is a JSON file (default: cow_config.json next to this module, override with
+the COW_CONFIG environment variable) with keys:
+    guild_members    list of player names
+    aliases          {"alias": "canonical member name"} for renamed / misspelled players
+    hero_forts       list of hero fortification names
+    titan_forts      list of titan fortification names
+    ignore_patterns  regex fragments for buff labels / UI text that are never player names
+
+load_config() compiles the file into a GuildConfig once and caches it by mtime, so
+long-running processes (dashboard) pick up roster edits without a restart.
+"""
+
+import os
+import re
+import json
+from pathlib import Path
+
+DEFAULT_CONFIG_FILE = Path(__file__).resolve().parent / "cow_config.json"
+
+_PAREN_RE = re.compile(r"\s*\(.*?\)")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+
+def strip_parens(name):
+    """Remove '(...)' annotations and surrounding whitespace"""
+    return _PAREN_RE.sub("", str(name)).strip()
+
+def clean_base_fort(name):
+    """Remove parentheses and whitespace, lowercased base fort name (used to decide Heroes/Titans)"""
+    return strip_parens(name).lower()
+
+class GuildConfig:
+    """
+    Precompiled roster / fort matcher built from a config dict.
+      match_member(name) -> canonical member name or None
+      fort_type(base)    -> "Heroes" / "Titans" / "Unknown"
+      is_ignored(text)   -> True for buff labels / UI text
+    """
+
+    def __init__(self, data):
+        self.members = set(data.get("guild_members", []))
+        self.aliases = dict(data.get("aliases", {}))
+        self.hero_forts = set(data.get("hero_forts", []))
+        self.titan_forts = set(data.get("titan_forts", []))
+
+        # lowercase key and alphanumeric key -> canonical name
+        self._by_norm = {}
+        self._by_alnum = {}
+        names = [(m, m) for m in self.members] + list(self.aliases.items())
+        for name, canonical in names:
+            norm = name.strip().lower()
+            self._by_norm.setdefault(norm, canonical)
+            alnum = _NON_ALNUM_RE.sub("", norm)
+            if alnum:
+                self._by_alnum.setdefault(alnum, canonical)
+
+        self._fort_types = {f.lower(): "Heroes" for f in self.hero_forts}
+        self._fort_types.update({f.lower(): "Titans" for f in self.titan_forts})
+
+        patterns = data.get("ignore_patterns", [])
+        self._ignore_re = re.compile("(" + "|".join(patterns) + ")", flags=re.IGNORECASE) if patterns else None
+
+    def match_member(self, name):
+        """Return the canonical guild member for name (exact, case-insensitive or alnum match), else None"""
+        norm = name.strip().lower()
+        canonical = self._by_norm.get(norm)
+        if canonical is not None:
+            return canonical
+        alnum = _NON_ALNUM_RE.sub("", norm)
+        if alnum:
+            return self._by_alnum.get(alnum)
+        return None
+
+    def fort_type(self, base_fort):
+        """Heroes/Titans classification of a lowercased base fort name"""
+        return self._fort_types.get(base_fort, "Unknown")
+
+    def is_ignored(self, text):
+        return bool(self._ignore_re and self._ignore_re.search(text))
+
+# path -> (mtime_ns, GuildConfig)
+_CACHE = {}
+
+def config_path():
+    env = os.environ.get("COW_CONFIG")
+    return Path(env) if env else DEFAULT_CONFIG_FILE
+
+def load_config(path=None):
+    """
+    Return the compiled GuildConfig for path (default: config_path()).
+    The file is re-read and recompiled only when its mtime changes. If a changed file
+    cannot be read or compiled (e.g. half-saved JSON) the last good config is kept;
+    the error is raised only when nothing has been loaded yet.
+    """
+    p = Path(path) if path else config_path()
+    key = str(p.resolve())
+    cached = _CACHE.get(key)
+    mtime = None
+    try:
+        mtime = p.stat().st_mtime_ns
+        if cached and cached[0] == mtime:
+            return cached[1]
+        cfg = GuildConfig(json.loads(p.read_text(encoding="utf-8")))
+    except Exception as e:
+        if not cached:
+            raise
+        print(f"Error reloading config {p}: {e} (keeping the previous one)")
+        # remember the broken mtime so the error is reported once, not on every call
+        if mtime is not None:
+            _CACHE[key] = (mtime, cached[1])
+        return cached[1]
+    _CACHE[key] = (mtime, cfg)
+    return cfg
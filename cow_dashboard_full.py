@@ -5,7 +5,6 @@
 
 import streamlit as st
 import pandas as pd
-import re
 import os
 import json
 from io import BytesIO
@@ -15,88 +14,11 @@ from datetime import datetime
 st.set_page_config(page_title="CoW Analyzer Dashboard", layout="wide")
 
 # =========================
-# Config utente (modifica qui se necessario)
+# Config utente: membri, alias e forti sono in cow_config.json
+# (ricaricato automaticamente quando il file cambia, nessun riavvio necessario)
 # =========================
-GUILD_MEMBERS = {
-    "LOKI","LoveBigFeet","Frodo","H4V0C","Wadjet..","HAI","Nemo","CKG","yoyo",
-    "Barah","FakeTaxi","georgesantos","Mokree","Masterlynch","DLGS","XungCa",
-    "BuzzKill","Obi-Wan Kenobi","DrStein","Samujas","Pelarian Jauh","ElenDil",
-    "kaliber 44","Biff","Pepp","Avalon"
-}
-
-HERO_FORTS = {
-    "Barracks","Mage Academy","Lighthouse","Foundry","Engineerium","Shooting Range",
-    "Bastion","Heroes' Bridge","Alchemy Tower","City Hall","Citadel"
-}
-
-TITAN_FORTS = {
-    "Bridge","Spring of Elements","Bastion of Fire","Gates of Nature","Bastion of Ice",
-    "Altar of Life","Ether Prism","Sun Temple","Moon Temple"
-}
-
-
-
-# Normalized guild members set and ignore pattern for defense parsing
-
-# Normalized guild members set and ignore pattern for defense parsing
-GUILD_MEMBERS_NORM = {g.strip().lower() for g in {
-    "loki","lovebigfeet","frodo","h4v0c","wadjet..","hai","nemo","ckg","yoyo",
-    "barah","faketaxi","georgesantos","mokree","masterlynch","dlgs","xungca",
-    "buzzkill","obi-wan kenobi","drstein","samujas","pelarian jauh","elendil",
-    "kaliber 44","biff","pepp","avalon"
-}}
-
-_IGNORE_RE = re.compile(
-    r"(skill|cooldown|decrease|increase|bonus|fortification|captured|victory|defeat|points|\+|attack|defense|buff|resist|reduction|chance|critical|stun|heal|regen|immunity)",
-    flags=re.IGNORECASE
-)
-
-def parse_defense_bytes_strict(bytes_io):
-    """Strict defense parser: only accept defenders that match guild members (normalized).
-    Returns DataFrame with columns Fortification, BaseFort, Defender, Type"""
-    text = bytes_io.getvalue().decode(errors="ignore").splitlines()
-    rows = []
-    hero_set = set(f.lower() for f in HERO_FORTS)
-    titan_set = set(f.lower() for f in TITAN_FORTS)
-    for line in text:
-        cols = [c.strip() for c in line.split(",")]
-        if len(cols) < 2:
-            continue
-        fort = cols[0]
-        result = cols[1].lower()
-        base_fort = re.sub(r"\s*\(.*?\)", "", fort).strip().lower()
-        defender = None
-        for cand in reversed(cols):
-            cand_clean = re.sub(r"\s*\(.*?\)", "", cand).strip()
-            if not cand_clean:
-                continue
-            cand_norm = cand_clean.lower()
-            # direct membership
-            if cand_norm in GUILD_MEMBERS_NORM:
-                defender = cand_clean
-                break
-            # alphanumeric normalization match
-            cand_alnum = re.sub(r'[^a-z0-9]','', cand_norm)
-            if cand_alnum and any(re.sub(r'[^a-z0-9]','',gm)==cand_alnum for gm in GUILD_MEMBERS_NORM):
-                defender = cand_clean
-                break
-            # skip buff/label-like candidates
-            if _IGNORE_RE.search(cand_clean):
-                continue
-            # otherwise skip
-            continue
-        if defender and result == "defeat":
-            if base_fort in hero_set:
-                btype = "Heroes"
-            elif base_fort in titan_set:
-                btype = "Titans"
-            else:
-                btype = "Unknown"
-            rows.append({"Fortification": fort, "BaseFort": base_fort, "Defender": defender, "Type": btype})
-    import pandas as pd
-    if not rows:
-        return pd.DataFrame(columns=["Fortification","BaseFort","Defender","Type"])
-    return pd.DataFrame(rows)
+from cow_config import load_config
+from cow_analyzer import parse_log_text, kind_from_name
 
 
 LOGS_DIR = Path("logs")             # dove salviamo i CSV caricati
@@ -110,69 +32,12 @@ LOGS_DIR.mkdir(exist_ok=True)
 # =========================
 # Funzioni di parsing (stessa logica usata)
 # =========================
-def _clean_base_fort(name):
-    return re.sub(r"\s*\(.*?\)","", name).strip().lower()
-
-def parse_attack_bytes(bytes_io):
-    # bytes_io: file caricato (io.BytesIO)
-    battles = []
-    bonuses = {}
-    text = bytes_io.getvalue().decode(errors="ignore").splitlines()
-    for line in text:
-        row = [x.strip() for x in line.split(",")]
-        if len(row) >= 4 and row[1] in ("Victory","Defeat") and row[2].startswith("+"):
-            fort_display = row[0]
-            base_fort = _clean_base_fort(fort_display)
-            result = row[1]
-            try:
-                points = float(row[2].replace("+",""))
-            except:
-                points = 0.0
-            attacker = re.sub(r"\s*\(.*?\)","",row[3]).strip()
-            if attacker in GUILD_MEMBERS:
-                battles.append({
-                    "Fortification": fort_display,
-                    "BaseFort": base_fort,
-                    "Attacker": attacker,
-                    "Result": result,
-                    "Points": points
-                })
-        elif len(row) >= 3 and row[1] == "Fortification captured" and row[2].startswith("+"):
-            base_fort = _clean_base_fort(row[0])
-            try:
-                bonus = float(row[2].replace("+",""))
-            except:
-                bonus = 0.0
-            bonuses[base_fort] = bonuses.get(base_fort,0)+bonus
-
-    df = pd.DataFrame(battles)
-    if df.empty:
-        return df
-
-    df["Type"] = df["BaseFort"].apply(lambda x: "Heroes" if x in set(f.lower() for f in HERO_FORTS) else "Titans")
-    # distribuzione bonus
-    bonus_rows = []
-    for base_fort, bonus in bonuses.items():
-        winners = df[(df["BaseFort"]==base_fort)&(df["Result"]=="Victory")]
-        if len(winners)>0 and bonus>0:
-            quota = bonus/len(winners)
-            for _, row in winners.iterrows():
-                bonus_rows.append({
-                    "Fortification": row["Fortification"],
-                    "BaseFort": base_fort,
-                    "Attacker": row["Attacker"],
-                    "Result": "Bonus",
-                    "Points": quota,
-                    "Type": row["Type"]
-                })
-    if bonus_rows:
-        df = pd.concat([df, pd.DataFrame(bonus_rows)], ignore_index=True)
-
-    return df
-
-def parse_defense_bytes(bytes_io):
-    # wrapper to call strict parser
-    return parse_defense_bytes_strict(bytes_io)
+def parse_log_bytes(bytes_io, name=""):
+    # bytes_io: file caricato (io.BytesIO). Tipo (attacco/difesa/misto) riconosciuto dal contenuto,
+    # il nome del file ('Attack Log'/'Defense Log') decide solo i blocchi senza membri della gilda.
+    # File letto e diviso una sola volta; in attacco solo i membri della gilda.
+    text = bytes_io.getvalue().decode(errors="ignore")
+    return parse_log_text(text, load_config(), members_only=True, hint=kind_from_name(name))
 
 # =========================
 # Utility season file
@@ -229,31 +94,23 @@ elif mode == "Scansiona cartella logs":
             per_date = {}
             for fname in selected:
                 fpath = LOGS_DIR / fname
-                # Determina tipo dal nome del file
-                low = fname.lower()
-                if "attack log" in low:
-                    with fpath.open("rb") as fh:
-                        df_a = parse_attack_bytes(BytesIO(fh.read()))
-                    df_d = None
-                elif "defense log" in low:
-                    with fpath.open("rb") as fh:
-                        df_d = parse_defense_bytes(BytesIO(fh.read()))
-                    df_a = None
-                else:
-                    st.error(f"Impossibile determinare tipo per: {fname} (usa 'Attack Log' o 'Defense Log' nel nome)")
-                    continue
+                # Tipo determinato dal contenuto; il nome del file vale solo come indizio
+                with fpath.open("rb") as fh:
+                    df_a, df_d = parse_log_bytes(BytesIO(fh.read()), fname)
+                if df_a.empty and df_d.empty:
+                    st.warning(f"Nessuna riga di attacco o difesa riconosciuta in: {fname}")
 
                 key = fname
-                per_date[key] = {"attack": df_a if df_a is not None else pd.DataFrame(), "defense": df_d if df_d is not None else pd.DataFrame()}
+                per_date[key] = {"attack": df_a, "defense": df_d}
 
                 # update season
-                if df_a is not None and not df_a.empty:
+                if not df_a.empty:
                     for t in ["Heroes","Titans"]:
                         sub = df_a[df_a["Type"]==t].groupby("Attacker")["Points"].sum()
                         skey = f"{t.lower()}_attack"
                         for player, pts in sub.items():
                             season[skey][player] = season[skey].get(player,0)+float(pts)
-                if df_d is not None and not df_d.empty:
+                if not df_d.empty:
                     for t in ["Heroes","Titans"]:
                         sub = df_d[df_d["Type"]==t]["Defender"].value_counts()
                         skey = f"{t.lower()}_defense"
@@ -324,6 +181,23 @@ elif mode == "Visualizza stagionale":
             bio.seek(0)
             st.download_button("Scarica Excel stagionale", data=bio.read(), file_name="season_summary.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
 
+elif mode == "Impostazioni":
+    from cow_config import config_path
+    cfg = load_config()
+    st.header("Impostazioni")
+    st.info(f"File di configurazione: {config_path().resolve()} (modifiche applicate automaticamente)")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("Membri gilda")
+        st.dataframe(pd.DataFrame(sorted(cfg.members), columns=["Member"]))
+        st.subheader("Alias")
+        st.dataframe(pd.DataFrame(sorted(cfg.aliases.items()), columns=["Alias","Member"]))
+    with col2:
+        st.subheader("Forti Eroi")
+        st.dataframe(pd.DataFrame(sorted(cfg.hero_forts), columns=["Fortification"]))
+        st.subheader("Forti Titani")
+        st.dataframe(pd.DataFrame(sorted(cfg.titan_forts), columns=["Fortification"]))
+
 else:
     st.write("Vai nella barra laterale e scegli un'azione.")
 
@@ -0,0 +1,101 @@
+"""
+cow_export.py
+Row-level export of parsed battles as a Hive-partitioned columnar dataset:
+
+    <dataset>/attack/season=<season>/war_date=<yyyy-mm-dd>/part-0.parquet
+    <dataset>/defense/season=<season>/war_date=<yyyy-mm-dd>/part-0.parquet
+
+attack rows are parse_attack_text() output (Victory/Defeat and distributed Bonus rows),
+defense rows are parse_defense_text_strict() output. season and war_date are partition
+keys (in the path, not in the files), so readers can prune them, e.g.
+
+    pd.read_parquet("dataset/attack", filters=[("season", "=", "2025-09")])
+    duckdb: SELECT * FROM read_parquet('dataset/attack/*/*/*.parquet', hive_partitioning=true)
+
+Wars are keyed by the dd-mm-yyyy date prefix of their file names; wars without one
+are not exported. Parquet needs pyarrow; without it each partition is written as part-0.csv instead.
+Every file is written to a hidden .part-0.<ext>.<random>.tmp file in the partition dir and
+moved into place with os.replace, so readers never see a partial war; re-exporting a war replaces its partition
+(an empty table removes it).
+"""
+
+import os
+import re
+import tempfile
+from pathlib import Path
+
+try:
+    import pyarrow  # noqa: F401
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+TABLES = ("attack", "defense")
+
+def war_date_value(war_key):
+    """ISO date (sortable) for a dd-mm-yyyy war key, None for keys without a date"""
+    m = re.fullmatch(r"(\d{2})-(\d{2})-(\d{4})", str(war_key))
+    if m:
+        return f"{m.group(3)}-{m.group(2)}-{m.group(1)}"
+    return None
+
+def partition_value(value):
+    """Path-safe partition value (season names)"""
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", str(value)).strip("_") or "unknown"
+
+def _write_atomic(df, path):
+    # hidden and not ending in .parquet/.csv: neither dataset discovery nor *.parquet globs pick it up
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        if path.suffix == ".parquet":
+            df.to_parquet(tmp, engine="pyarrow", index=False)
+        else:
+            df.to_csv(tmp, index=False, encoding="utf-8")
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+def _remove_stale(part_dir, keep=None):
+    """Drop partition files other than keep: the other format's part-0 and temp files left by a killed run"""
+    for stale in list(part_dir.glob("part-0.*")) + list(part_dir.glob(".part-0.*.tmp")):
+        if stale != keep:
+            stale.unlink()
+
+def export_war(dataset_dir, season, war_key, attack_df, defense_df):
+    """
+    Write one war's parsed rows into the attack/defense partitions for (season, war date).
+    An empty table removes that table's existing partition file, so a re-export always
+    replaces the previous one. war_key must be a dd-mm-yyyy date.
+    Returns the list of written files.
+    """
+    war_date = war_date_value(war_key)
+    if war_date is None:
+        raise ValueError(f"war key {war_key!r} is not a dd-mm-yyyy date")
+    ext = ".parquet" if HAVE_PYARROW else ".csv"
+    written = []
+    for table, df in zip(TABLES, (attack_df, defense_df)):
+        part_dir = Path(dataset_dir) / table / f"season={partition_value(season)}" / f"war_date={war_date}"
+        if df is None or df.empty:
+            _remove_stale(part_dir)
+            continue
+        part_dir.mkdir(parents=True, exist_ok=True)
+        out = part_dir / f"part-0{ext}"
+        _write_atomic(df.reset_index(drop=True), out)
+        _remove_stale(part_dir, keep=out)
+        written.append(out)
+    return written
+
+def export_wars(dataset_dir, season, per_war):
+    """
+    Export every war of a per_war dict ({key: {"attack": df, "defense": df, ...}}).
+    Wars whose key is not a dd-mm-yyyy date have no war_date partition and are skipped with a warning.
+    """
+    written = []
+    for key, data in per_war.items():
+        if war_date_value(key) is None:
+            print(f"Warning: not exporting war {key!r}: no dd-mm-yyyy date in the file name")
+            continue
+        written.extend(export_war(dataset_dir, season, key, data["attack"], data["defense"]))
+    return written
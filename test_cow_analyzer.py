@@ -0,0 +1,116 @@
+"""Checks for the single-pass log parser (run with: python -m pytest -q)"""
+
+import json
+
+from cow_config import GuildConfig
+from cow_analyzer import parse_log_text, parse_attack_text, parse_defense_text_strict, parse_war
+
+ROSTER = {
+    "guild_members": ["LOKI", "Frodo", "Nemo", "Pepp", "HAI"],
+    "hero_forts": ["Barracks", "Citadel"],
+    "titan_forts": ["Bridge"],
+    "ignore_patterns": ["skill", "cooldown"],
+}
+CFG = GuildConfig(ROSTER)
+
+ATTACK_LOG = """Fort,Result,Points,Attacker,Defender
+Barracks (1),Victory,+20,LOKI (100),E1
+Barracks (1),Victory,+20,Frodo,E2
+Bridge,Victory,+10,LOKI,E3
+Bridge,Defeat,+5,Frodo,E4
+Barracks (1),Fortification captured,+300
+Bridge,Fortification captured,+200
+"""
+
+DEFENSE_LOG = """Fort,Result,Points,Attacker,Defender
+Bridge,Defeat,+0,E5,Nemo (99)
+Citadel,Defeat,+0,E6,skill cooldown,Pepp
+Barracks (2),Victory,+20,E7,Pepp
+Barracks (2),Fortification captured,+300
+Bridge,Victory,+10,E8,Nemo
+Bridge,Fortification captured,+200
+"""
+
+def _attack_totals(df):
+    return df.groupby(["Attacker","Result"])["Points"].sum().to_dict()
+
+def _defense_totals(df):
+    return df["Defender"].value_counts().to_dict()
+
+def test_concatenated_logs_match_separate_parsing():
+    attack_df, _ = parse_log_text(ATTACK_LOG, CFG)
+    _, defense_df = parse_log_text(DEFENSE_LOG, CFG)
+    for combined in (ATTACK_LOG + DEFENSE_LOG, DEFENSE_LOG + ATTACK_LOG):
+        a, d = parse_log_text(combined, CFG)
+        assert _attack_totals(a) == _attack_totals(attack_df)
+        assert _defense_totals(d) == _defense_totals(defense_df)
+    # the enemy's capture bonuses in the defense part are not credited to our attackers
+    bonus = attack_df[attack_df["Result"]=="Bonus"].groupby("Attacker")["Points"].sum().to_dict()
+    assert bonus == {"LOKI": 150.0 + 200.0, "Frodo": 150.0}
+
+def test_single_logs_match_forced_kind():
+    assert _attack_totals(parse_log_text(ATTACK_LOG, CFG)[0]) == _attack_totals(parse_attack_text(ATTACK_LOG, CFG))
+    assert _defense_totals(parse_log_text(DEFENSE_LOG, CFG)[1]) == _defense_totals(parse_defense_text_strict(DEFENSE_LOG, CFG))
+    assert parse_log_text(ATTACK_LOG, CFG)[1].empty
+    assert parse_log_text(DEFENSE_LOG, CFG)[0].empty
+
+def test_attack_log_without_roster_members_is_kept():
+    text = "Barracks (1),Victory,+20,NewRecruit (1),E1\nBarracks,Fortification captured,+100"
+    a, d = parse_log_text(text, CFG)
+    assert len(a) == len(parse_attack_text(text, CFG)) == 2
+    assert d.empty
+    assert parse_log_text(text, CFG, members_only=True)[0].empty
+
+def test_non_members_kept_in_mixed_logs():
+    a, _ = parse_log_text(ATTACK_LOG + "Citadel,Victory,+15,NewRecruit,E9\n" + DEFENSE_LOG, CFG)
+    assert "NewRecruit" in set(a["Attacker"])
+
+# defense log whose defenders are all new recruits (not yet in the roster)
+RECRUIT_DEFENSE_LOG = """Fort,Result,Points,Attacker,Defender
+Bridge,Defeat,+0,E5,NewRecruit
+Barracks (2),Victory,+20,E7,OtherRecruit
+Barracks (2),Fortification captured,+300
+"""
+
+def test_defense_log_without_roster_members_is_not_counted_as_attacks(tmp_path):
+    a, d = parse_log_text(RECRUIT_DEFENSE_LOG, CFG, hint="defense")
+    assert a.empty and d.empty
+    a, d = parse_log_text("Defense Log 08-09-2025\n" + RECRUIT_DEFENSE_LOG, CFG)
+    assert a.empty and d.empty
+    # through parse_war the file name is the hint
+    config_file = tmp_path / "cow_config.json"
+    config_file.write_text(json.dumps(ROSTER), encoding="utf-8")
+    path = tmp_path / "08-09-2025 Guild Defense Log.csv"
+    path.write_text(RECRUIT_DEFENSE_LOG, encoding="utf-8")
+    a, d = parse_war({"files": [path]}, config_file)
+    assert a.empty and d.empty
+
+def test_mixed_log_defense_part_starting_with_non_member():
+    defense_part = """Fort,Result,Points,Attacker,Defender
+Bridge,Victory,+10,E9,NewRecruit
+Bridge,Fortification captured,+200
+Bridge,Defeat,+0,E5,Nemo (99)
+Citadel,Defeat,+0,E6,Pepp
+"""
+    a, d = parse_log_text(ATTACK_LOG + defense_part, CFG)
+    attack_df, _ = parse_log_text(ATTACK_LOG, CFG)
+    assert "E9" not in set(a["Attacker"])
+    assert _attack_totals(a) == _attack_totals(attack_df)
+    assert _defense_totals(d) == {"Nemo": 1, "Pepp": 1}
+
+def test_mixed_log_defense_part_without_members_is_skipped(capsys):
+    a, d = parse_log_text(ATTACK_LOG + RECRUIT_DEFENSE_LOG, CFG)
+    attack_df, _ = parse_log_text(ATTACK_LOG, CFG)
+    assert _attack_totals(a) == _attack_totals(attack_df)
+    assert d.empty
+    assert "skipped" in capsys.readouterr().out
+
+def test_enemy_named_like_a_member_does_not_flip_a_defense_log():
+    text = """Fort,Result,Points,Attacker,Defender
+Bridge,Victory,+10,HAI,E1
+Bridge,Defeat,+0,E5,Nemo
+Citadel,Defeat,+0,E6,Pepp
+"""
+    a, d = parse_log_text(text, CFG)
+    assert a.empty
+    assert _defense_totals(d) == {"Nemo": 1, "Pepp": 1}
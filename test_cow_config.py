@@ -0,0 +1,75 @@
+"""Checks for the guild config matcher and its mtime-cached loader (run with: python -m pytest -q)"""
+
+import os
+import json
+
+import pytest
+
+from cow_config import GuildConfig, load_config
+
+ROSTER = {
+    "guild_members": ["LOKI", "Obi-Wan Kenobi", "Wadjet.."],
+    "aliases": {"ObiWan": "Obi-Wan Kenobi"},
+    "hero_forts": ["Barracks"],
+    "titan_forts": ["Bridge"],
+    "ignore_patterns": ["skill", "\\+"],
+}
+
+def _write(path, data, mtime_ns):
+    path.write_text(json.dumps(data) if isinstance(data, dict) else data, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+def test_match_member_exact_alias_and_alnum():
+    cfg = GuildConfig(ROSTER)
+    assert cfg.match_member("LOKI") == "LOKI"
+    assert cfg.match_member(" loki ") == "LOKI"
+    assert cfg.match_member("ObiWan") == "Obi-Wan Kenobi"
+    assert cfg.match_member("obiwan kenobi") == "Obi-Wan Kenobi"
+    assert cfg.match_member("Wadjet") == "Wadjet.."
+    assert cfg.match_member("Stranger") is None
+    assert cfg.match_member("...") is None
+
+def test_fort_type_and_ignore():
+    cfg = GuildConfig(ROSTER)
+    assert cfg.fort_type("barracks") == "Heroes"
+    assert cfg.fort_type("bridge") == "Titans"
+    assert cfg.fort_type("moon temple") == "Unknown"
+    assert cfg.is_ignored("Skill cooldown")
+    assert cfg.is_ignored("+5%")
+    assert not cfg.is_ignored("LOKI")
+
+def test_load_config_cached_until_mtime_changes(tmp_path):
+    path = tmp_path / "cow_config.json"
+    _write(path, ROSTER, 1_000_000_000)
+    cfg = load_config(path)
+    assert load_config(path) is cfg
+
+    _write(path, dict(ROSTER, guild_members=["LOKI", "Pepp"]), 2_000_000_000)
+    reloaded = load_config(path)
+    assert reloaded is not cfg
+    assert reloaded.match_member("pepp") == "Pepp"
+
+def test_load_config_keeps_last_good_on_bad_reload(tmp_path, capsys):
+    path = tmp_path / "cow_config.json"
+    _write(path, ROSTER, 1_000_000_000)
+    cfg = load_config(path)
+
+    _write(path, '{"guild_members": [', 2_000_000_000)
+    assert load_config(path) is cfg
+    assert load_config(path) is cfg
+    # reported once for the broken file, not on every call
+    assert capsys.readouterr().out.count("Error reloading config") == 1
+
+    path.unlink()
+    assert load_config(path) is cfg
+
+    _write(path, dict(ROSTER, guild_members=["Pepp"]), 3_000_000_000)
+    assert load_config(path).match_member("Pepp") == "Pepp"
+
+def test_load_config_raises_without_cached_config(tmp_path):
+    path = tmp_path / "cow_config.json"
+    with pytest.raises(FileNotFoundError):
+        load_config(path)
+    _write(path, "{not json", 1_000_000_000)
+    with pytest.raises(json.JSONDecodeError):
+        load_config(path)
@@ -0,0 +1,71 @@
+"""Checks for the partitioned row export, CSV path (run with: python -m pytest -q)"""
+
+import pandas as pd
+import pytest
+
+import cow_export
+from cow_export import export_war, export_wars
+
+ATTACK = pd.DataFrame([
+    {"Fortification": "Barracks (1)", "BaseFort": "barracks", "Attacker": "LOKI", "Result": "Victory", "Points": 20.0, "Type": "Heroes"},
+    {"Fortification": "Barracks (1)", "BaseFort": "barracks", "Attacker": "LOKI", "Result": "Bonus", "Points": 300.0, "Type": "Heroes"},
+])
+DEFENSE = pd.DataFrame([
+    {"Fortification": "Bridge", "BaseFort": "bridge", "Defender": "Nemo", "Type": "Titans"},
+])
+EMPTY = pd.DataFrame()
+
+@pytest.fixture(autouse=True)
+def csv_only(monkeypatch):
+    monkeypatch.setattr(cow_export, "HAVE_PYARROW", False)
+
+def _part(root, table, season="S1", war_date="2025-09-08"):
+    return root / table / f"season={season}" / f"war_date={war_date}"
+
+def _files(root):
+    return sorted(str(p.relative_to(root)) for p in root.rglob("*") if p.is_file())
+
+def test_export_writes_partitions(tmp_path):
+    written = export_war(tmp_path, "S1", "08-09-2025", ATTACK, DEFENSE)
+    assert written == [_part(tmp_path, "attack") / "part-0.csv", _part(tmp_path, "defense") / "part-0.csv"]
+    assert len(pd.read_csv(written[0])) == 2
+    # only the two partition files, no temp files left behind
+    assert _files(tmp_path) == [
+        "attack/season=S1/war_date=2025-09-08/part-0.csv",
+        "defense/season=S1/war_date=2025-09-08/part-0.csv",
+    ]
+
+def test_reexport_replaces_partition(tmp_path):
+    export_war(tmp_path, "S1", "08-09-2025", ATTACK, DEFENSE)
+    export_war(tmp_path, "S1", "08-09-2025", ATTACK.head(1), DEFENSE)
+    assert len(pd.read_csv(_part(tmp_path, "attack") / "part-0.csv")) == 1
+
+def test_empty_table_removes_partition(tmp_path):
+    export_war(tmp_path, "S1", "08-09-2025", ATTACK, DEFENSE)
+    written = export_war(tmp_path, "S1", "08-09-2025", ATTACK, EMPTY)
+    assert written == [_part(tmp_path, "attack") / "part-0.csv"]
+    assert not list(_part(tmp_path, "defense").glob("part-0.*"))
+
+def test_other_format_and_leftover_temp_are_cleaned(tmp_path):
+    part = _part(tmp_path, "attack")
+    part.mkdir(parents=True)
+    (part / "part-0.parquet").write_bytes(b"old")
+    (part / ".part-0.csv.abc123.tmp").write_text("partial")
+    export_war(tmp_path, "S1", "08-09-2025", ATTACK, EMPTY)
+    assert [p.name for p in part.iterdir()] == ["part-0.csv"]
+
+def test_undated_wars_are_skipped(tmp_path, capsys):
+    per_war = {
+        "08-09-2025": {"attack": ATTACK, "defense": DEFENSE},
+        "renamed.csv": {"attack": ATTACK, "defense": DEFENSE},
+    }
+    written = export_wars(tmp_path, "S1", per_war)
+    assert len(written) == 2
+    assert "renamed.csv" in capsys.readouterr().out
+    assert not any("renamed" in f for f in _files(tmp_path))
+    with pytest.raises(ValueError):
+        export_war(tmp_path, "S1", "renamed.csv", ATTACK, DEFENSE)
+
+def test_season_partition_value_is_path_safe(tmp_path):
+    export_war(tmp_path, "2025 / autumn", "08-09-2025", ATTACK, EMPTY)
+    assert (tmp_path / "attack" / "season=2025_autumn").is_dir()